@@ -8,19 +8,266 @@ https://docs.apify.com/sdk/python
 
 from __future__ import annotations
 
-import json
 import re
 import asyncio
 from datetime import timedelta
-from typing import Any
-import logging
-import os
-import requests
+from typing import TYPE_CHECKING, Any
+import orjson
 from apify import Actor
-from crawlee import Request
-from crawlee.crawlers import PlaywrightCrawler, PlaywrightCrawlingContext
-from playwright.async_api import Page, Browser, BrowserContext, Error as PlaywrightError
-from bs4 import BeautifulSoup
+from crawlee import ConcurrencySettings, Request
+from crawlee.crawlers import (
+    PlaywrightCrawler,
+    PlaywrightCrawlingContext,
+    PlaywrightPreNavCrawlingContext,
+)
+from playwright.async_api import Error as PlaywrightError
+from selectolax.parser import HTMLParser
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+# Compiled once at import time so the per-video extraction loops don't pay
+# re-cache lookups on every selector attempt.
+_DURATION_RE = re.compile(r"^\d{1,2}:\d{2}(:\d{2})?$")
+_LIKES_RE = re.compile(r"([\d,\.]+[KMB]?)", re.IGNORECASE)
+_LIKES_ARIA_RE = re.compile(r"([\d,\.]+[KMB]?)\s*likes?", re.IGNORECASE)
+_ISO_DUR_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?")
+_WATCH_ID_RE = re.compile(r"/watch\?v=([^&]+)")
+
+# Strips spaces and @ from the configured channel name in one pass
+_CHANNEL_TRANS = str.maketrans("", "", " @")
+
+# We only read textual metadata (and image URLs, never image bytes), so
+# these resources are pure wasted bandwidth. Stylesheets stay enabled
+# because the readiness waits rely on element visibility.
+_BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+# Ad networks, the video CDN and YouTube's own telemetry beacons - none of
+# them carry metadata we read, but each costs a connection and interceptor
+# time on every watch page.
+_BLOCKED_URL_FRAGMENTS = (
+    "doubleclick",
+    "googlevideo",
+    "googleads",
+    "googleadservices",
+    "google-analytics",
+    "youtubei/v1/log_event",
+    "youtube.com/api/stats",
+    "youtube.com/ptracking",
+)
+
+# Ask YouTube for English pages so the text-based selectors keep matching
+_EXTRA_HTTP_HEADERS = {"Accept-Language": "en-US,en;q=0.9"}
+
+# Selector cascades, hoisted to module scope so they aren't rebuilt on
+# every call. Duration entries are pre-tagged with whether the value
+# lives in a meta tag's content attribute or in the element text.
+_TITLE_READY_SELECTOR = (
+    "#title h1.style-scope.ytd-watch-metadata yt-formatted-string, "
+    "#title h1 yt-formatted-string, "
+    "#title h1, "
+    "h1.ytd-watch-metadata, "
+    "ytd-watch-metadata h1"
+)
+
+_DURATION_PROBES: tuple[dict[str, str], ...] = (
+    {"sel": 'meta[itemprop="duration"]', "attr": "content"},  # ISO 8601 format
+    {"sel": "span.ytp-time-duration"},  # Video player duration
+    {"sel": ".ytp-time-duration"},  # Alternative player duration selector
+    {"sel": "ytd-thumbnail-overlay-time-status-renderer span"},  # Thumbnail overlay
+    {"sel": "span.style-scope.ytd-thumbnail-overlay-time-status-renderer"},
+    {"sel": 'yt-formatted-string[aria-label*="duration"]'},
+    {"sel": ".ytd-watch-info-text span", "contains": ":"},  # Watch info text
+)
+
+_LIKES_PROBES: tuple[dict[str, str], ...] = (
+    {
+        "sel": "segmented-like-dislike-button-view-model button"
+        " .yt-spec-button-shape-next__button-text-content"
+    },
+    {"sel": 'button[aria-label*="like"] span'},
+    {"sel": 'yt-formatted-string[id="text"]', "contains": "likes"},
+    {"sel": '[aria-label*="like"]'},
+    {"sel": 'button[aria-label*="Like"]'},
+)
+
+# Remembers which selector matched last per field ("duration", "likes").
+# YouTube's layout is stable within a crawl, so later videos try the
+# known-good selector first instead of re-walking the cascade from the top.
+_WINNERS: dict[str, str] = {}
+
+# Walks a whole selector cascade inside the browser and returns the first
+# hit, so each cascade costs one CDP round-trip instead of one per selector.
+# ``contains`` stands in for the Playwright-only :has-text() pseudo-class,
+# and ``attr`` names the attribute to read instead of textContent.
+_PROBE_JS = """(probes) => {
+    for (const p of probes) {
+        let els;
+        try { els = document.querySelectorAll(p.sel); } catch (e) { continue; }
+        for (const el of els) {
+            const text = (el.textContent || '').trim();
+            const aria = el.getAttribute('aria-label');
+            if (p.contains && !text.includes(p.contains)) continue;
+            if (!text && !aria && !p.attr) continue;
+            return {
+                selector: p.sel,
+                value: p.attr ? el.getAttribute(p.attr) : text,
+                aria: aria,
+            };
+        }
+    }
+    return null;
+}"""
+
+# All variants target the comments header, so one comma-joined query
+# replaces six sequential probes.
+_COMMENTS_SELECTOR = (
+    "#title.style-scope.ytd-comments-header-renderer yt-formatted-string span, "
+    "ytd-comments-header-renderer #count, "
+    "ytd-comments-header-renderer .count-text, "
+    "ytd-comments-header-renderer #title #count, "
+    "yt-formatted-string.count-text, "
+    "h2#count yt-formatted-string span"
+)
+
+_VIDEO_GRID_SELECTORS: tuple[str, ...] = (
+    "ytd-two-column-browse-results-renderer div#primary ytd-rich-grid-renderer div#contents ytd-rich-item-renderer",
+    "ytd-rich-grid-renderer div#contents ytd-rich-item-renderer",
+    "ytd-rich-item-renderer",
+)
+
+
+def _is_closed_error(e: BaseException) -> bool:
+    """Return True when the error means the page/context/browser went away.
+
+    Stringifies the exception once; callers used to test two substrings
+    against two separate ``str(e)`` conversions at every except site.
+    """
+    message = str(e)
+    return (
+        "Target page, context or browser has been closed" in message
+        or "Target closed" in message
+    )
+
+
+def _normalize_duration(duration: str) -> str | None:
+    """Normalize an ISO-8601 (PT4M13S) or clock-style (4:13) duration string.
+
+    Returns ``None`` when the text doesn't look like a duration at all.
+    """
+    duration = duration.strip()
+    # Check if it's ISO 8601 format (PT4M13S -> 4:13): one regex pass
+    # replaces the old translate/split/branch normalization
+    if duration.startswith("PT"):
+        match = _ISO_DUR_RE.match(duration)
+        if match:
+            hours, minutes, seconds = (int(part or 0) for part in match.groups())
+            return (
+                f"{hours}:{minutes:02d}:{seconds:02d}"
+                if hours
+                else f"{minutes}:{seconds:02d}"
+            )
+        return None
+    # Check if it's already in time format (MM:SS or HH:MM:SS)
+    if _DURATION_RE.match(duration):
+        return duration
+    return None
+
+
+def _parse_static_fields(html: str) -> dict[str, Any]:
+    """Parse metadata embedded in the static watch-page HTML.
+
+    selectolax (lexbor) parses in-process in C, so one ``page.content()``
+    round-trip plus this parse is far cheaper than probing the same meta
+    tags through Playwright selector queries.
+    """
+    tree = HTMLParser(html)
+    fields: dict[str, Any] = {}
+
+    node = tree.css_first('meta[property="og:title"]')
+    if node:
+        fields["title"] = node.attributes.get("content")
+
+    node = tree.css_first('meta[property="og:description"]')
+    if node:
+        fields["summary"] = node.attributes.get("content")
+
+    node = tree.css_first('meta[itemprop="duration"]')
+    if node:
+        fields["duration"] = node.attributes.get("content")
+
+    node = tree.css_first('span[itemprop="author"] link[itemprop="name"]')
+    if node:
+        fields["creators"] = node.attributes.get("content")
+
+    return {key: value for key, value in fields.items() if value}
+
+
+async def _probe_first(page: Page, probes, field: str | None = None) -> dict[str, Any] | None:
+    """Evaluate a selector cascade in-page and return the first hit.
+
+    Returns a dict with ``selector``, ``value`` and ``aria`` keys, or
+    ``None`` when nothing matched or the evaluate itself failed. When
+    ``field`` is given, the selector that last matched for that field is
+    tried first on subsequent calls.
+    """
+    probes = list(probes)
+    winner = _WINNERS.get(field) if field else None
+    if winner:
+        probes.sort(key=lambda probe: probe["sel"] != winner)
+    try:
+        hit = await page.evaluate(_PROBE_JS, probes)
+    except Exception as e:
+        Actor.log.debug("Selector probe failed: %s", e)
+        return None
+    if hit and field:
+        _WINNERS[field] = hit["selector"]
+    return hit
+
+
+async def _scroll_until_stable(page: Page, max_rounds: int = 5) -> None:
+    """Scroll to the bottom until the page height stops growing.
+
+    YouTube's infinite scroll appends a batch of cards within a few hundred
+    milliseconds of the scroll event; waiting on the height change reacts
+    as soon as the batch lands instead of sleeping a fixed interval.
+    """
+    last_height = 0
+    for _ in range(max_rounds):
+        try:
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            try:
+                await page.wait_for_function(
+                    "h => document.body.scrollHeight > h",
+                    arg=last_height,
+                    timeout=2000,
+                )
+            except Exception:
+                pass
+            height = await page.evaluate("document.body.scrollHeight")
+        except Exception as e:
+            Actor.log.debug("Scroll round failed: %s", e)
+            return
+        if height == last_height:
+            break
+        last_height = height
+
+
+async def _first_text(page: Page, selectors) -> str | None:
+    """Return the first non-empty text content among the given selectors.
+
+    ``query_selector`` resolves to ``None`` or an element handle in a single
+    round-trip, unlike the locator ``count()`` + ``text_content()`` pair.
+    """
+    for selector in selectors:
+        try:
+            element = await page.query_selector(selector)
+            if element:
+                text = await element.text_content()
+                if text and text.strip():
+                    return text.strip()
+        except Exception as e:
+            Actor.log.debug("Error with selector %s: %s", selector, e)
+    return None
 
 
 async def wait_for_video_page_ready(page: Page, timeout: int = 30000) -> bool:
@@ -34,30 +281,22 @@ async def wait_for_video_page_ready(page: Page, timeout: int = 30000) -> bool:
                 state="attached",
             )
         except Exception as e:
-            Actor.log.debug(f"Basic page structure not found immediately: {e}")
-
-        # Wait for title element (one of the most important elements)
-        title_selectors = [
-            "#title h1.style-scope.ytd-watch-metadata yt-formatted-string",
-            "#title h1 yt-formatted-string",
-            "#title h1",
-            "h1.ytd-watch-metadata",
-            "ytd-watch-metadata h1",
-        ]
+            Actor.log.debug("Basic page structure not found immediately: %s", e)
 
-        for selector in title_selectors:
-            try:
-                await page.wait_for_selector(
-                    selector,
-                    timeout=min(timeout // len(title_selectors), 10000),
-                    state="visible",
-                )
-                Actor.log.debug(
-                    f"Video page ready - title found with selector: {selector}"
-                )
-                return True
-            except Exception:
-                continue
+        # Wait for title element (one of the most important elements).
+        # A comma-joined selector list is evaluated by the browser in one
+        # pass, so the first variant to appear wins immediately instead of
+        # each alternative burning its own share of the timeout.
+        try:
+            await page.wait_for_selector(
+                _TITLE_READY_SELECTOR,
+                timeout=min(timeout, 10000),
+                state="visible",
+            )
+            Actor.log.debug("Video page ready - title element found")
+            return True
+        except Exception:
+            pass
 
         # Fallback: check if page has loaded at all
         try:
@@ -70,10 +309,13 @@ async def wait_for_video_page_ready(page: Page, timeout: int = 30000) -> bool:
         except Exception:
             pass
 
-        # Last resort: check if page has any content
+        # Last resort: check if page has any content. A boolean evaluate
+        # avoids serializing the whole body text over the CDP bridge.
         try:
-            body_content = await page.locator("body").text_content()
-            if body_content and len(body_content.strip()) > 0:
+            has_content = await page.evaluate(
+                "() => !!document.body && document.body.childElementCount > 0"
+            )
+            if has_content:
                 Actor.log.debug("Video page has content (last resort check)")
                 return True
         except Exception:
@@ -86,6 +328,246 @@ async def wait_for_video_page_ready(page: Page, timeout: int = 30000) -> bool:
         return False
 
 
+async def get_youtube_video_info(page: Page) -> dict[str, Any]:
+    """Extract detailed video information (duration, likes, comments count,
+    creator and summary) from an already-loaded YouTube watch page.
+
+    Returns a dict with whatever fields could be extracted; missing fields
+    stay ``None`` so callers can merge the result over listing data.
+    """
+    try:
+        video_url = page.url
+    except PlaywrightError:
+        video_url = None
+
+    detailed: dict[str, Any] = {
+        "video_url": video_url,
+        "title": None,
+        "duration": None,
+        "likes": None,
+        "creators": None,
+        "summary": None,
+        "comments_count": None,
+    }
+
+    if page.is_closed():
+        Actor.log.warning("Page is closed, skipping video extraction")
+        return detailed
+
+    # Fast path: every watch page embeds its metadata as JSON in
+    # window.ytInitialPlayerResponse. Reading it in one evaluate replaces
+    # ~20 selector round-trips; the selector cascades below only run for
+    # fields the JSON did not provide.
+    try:
+        player_data = await page.evaluate(
+            """() => {
+                const vd = (window.ytInitialPlayerResponse || {}).videoDetails || {};
+                return {
+                    title: vd.title || null,
+                    lengthSeconds: vd.lengthSeconds || null,
+                    author: vd.author || null,
+                    shortDescription: vd.shortDescription || null,
+                };
+            }"""
+        )
+    except Exception as e:
+        Actor.log.debug("Could not read ytInitialPlayerResponse: %s", e)
+        player_data = None
+
+    if player_data:
+        if player_data.get("title"):
+            detailed["title"] = player_data["title"]
+        if player_data.get("author"):
+            detailed["creators"] = player_data["author"]
+        if player_data.get("shortDescription"):
+            detailed["summary"] = player_data["shortDescription"]
+        if player_data.get("lengthSeconds"):
+            try:
+                total_seconds = int(player_data["lengthSeconds"])
+                hours, remainder = divmod(total_seconds, 3600)
+                minutes, seconds = divmod(remainder, 60)
+                detailed["duration"] = (
+                    f"{hours}:{minutes:02d}:{seconds:02d}"
+                    if hours
+                    else f"{minutes}:{seconds:02d}"
+                )
+            except (TypeError, ValueError):
+                pass
+        Actor.log.info(
+            f"Extracted metadata from ytInitialPlayerResponse: {detailed['title']}"
+        )
+
+    # Static-HTML fallback: one content() fetch parsed in-process covers the
+    # meta-tag fields without further browser round-trips.
+    missing = [
+        key for key in ("title", "duration", "creators", "summary") if not detailed[key]
+    ]
+    if missing:
+        try:
+            static_fields = _parse_static_fields(await page.content())
+        except Exception as e:
+            Actor.log.debug("Static HTML parse failed: %s", e)
+            static_fields = {}
+        for field in missing:
+            value = static_fields.get(field)
+            if field == "duration" and value:
+                value = _normalize_duration(value)
+            if value:
+                detailed[field] = value
+
+    try:
+        # Extract duration - the whole selector cascade runs in one evaluate.
+        # Skipped entirely when the JSON fast path already provided it.
+        if not detailed["duration"]:
+            hit = await _probe_first(page, _DURATION_PROBES, field="duration")
+            if hit and hit.get("value"):
+                normalized = _normalize_duration(hit["value"])
+                if normalized:
+                    detailed["duration"] = normalized
+                    Actor.log.info(
+                        f"Found duration with selector '{hit['selector']}': "
+                        f"{detailed['duration']}"
+                    )
+
+        if not detailed["duration"]:
+            Actor.log.warning("Could not extract video duration with any selector")
+
+        # Extract likes. Like the comment count, the number ships in
+        # ytInitialData, so try one JSON read before probing the rendered
+        # like-button variants.
+        try:
+            likes_text = await page.evaluate(
+                """() => {
+                    try {
+                        const sections = window.ytInitialData.contents
+                            .twoColumnWatchNextResults.results.results.contents;
+                        for (const section of sections) {
+                            const info = section.videoPrimaryInfoRenderer;
+                            if (!info) continue;
+                            const buttons = info.videoActions
+                                ?.menuRenderer?.topLevelButtons || [];
+                            for (const button of buttons) {
+                                const vm = button
+                                    .segmentedLikeDislikeButtonViewModel
+                                    ?.likeButtonViewModel?.likeButtonViewModel
+                                    ?.toggleButtonViewModel?.toggleButtonViewModel
+                                    ?.defaultButtonViewModel?.buttonViewModel;
+                                if (vm?.title) return vm.title;
+                            }
+                        }
+                    } catch (e) {}
+                    return null;
+                }"""
+            )
+        except Exception as e:
+            Actor.log.debug("Could not read likes from ytInitialData: %s", e)
+            likes_text = None
+
+        if likes_text:
+            match = _LIKES_RE.search(likes_text)
+            detailed["likes"] = match.group(1) if match else likes_text
+            Actor.log.info(f"Found likes from ytInitialData: {detailed['likes']}")
+
+        # Fallback: one batched probe over the like-button variants
+        hit = None
+        if not detailed["likes"]:
+            hit = await _probe_first(page, _LIKES_PROBES, field="likes")
+        if hit:
+            text = (hit.get("value") or "").strip()
+            if text:
+                # Extract number from text (e.g., "1.2K", "123", "1.5M")
+                match = _LIKES_RE.search(text)
+                if match:
+                    detailed["likes"] = match.group(1)
+                    Actor.log.info(f"Found likes: {detailed['likes']}")
+                else:
+                    # If no match but text exists, use it directly
+                    detailed["likes"] = text
+                    Actor.log.info(f"Found likes (direct): {detailed['likes']}")
+            elif hit.get("aria"):
+                # Extract number from aria-label like "1.2K likes" or "123 likes"
+                match = _LIKES_ARIA_RE.search(hit["aria"])
+                if match:
+                    detailed["likes"] = match.group(1)
+                    Actor.log.info(f"Found likes from aria-label: {detailed['likes']}")
+
+        # Extract comments count.
+        # The count ships in ytInitialData, so try one JSON read before
+        # resorting to scrolling the lazy-loaded comments header into view
+        try:
+            comments_count = await page.evaluate(
+                """() => {
+                    try {
+                        const sections = window.ytInitialData.contents
+                            .twoColumnWatchNextResults.results.results.contents;
+                        for (const section of sections) {
+                            const header = section.itemSectionRenderer
+                                ?.contents?.[0]?.commentsEntryPointHeaderRenderer;
+                            if (header) {
+                                return header.commentCount?.simpleText || null;
+                            }
+                        }
+                    } catch (e) {}
+                    return null;
+                }"""
+            )
+        except Exception as e:
+            Actor.log.debug("Could not read comment count from ytInitialData: %s", e)
+            comments_count = None
+
+        if not comments_count:
+            # Fallback: scroll to comments so the lazy-loaded header appears
+            try:
+                await page.evaluate(
+                    "window.scrollBy(0, document.body.scrollHeight / 2);"
+                )
+                await page.wait_for_timeout(1000)  # Reduced from 2000 to 1000
+            except Exception:
+                pass
+            comments_count = await _first_text(page, (_COMMENTS_SELECTOR,))
+
+        if comments_count:
+            detailed["comments_count"] = comments_count
+            Actor.log.info(f"Found comments count: {detailed['comments_count']}")
+
+        # Extract creator/channel name - fallback when JSON fast path missed it
+        if not detailed["creators"]:
+            creator = await _first_text(page, ("ytd-channel-name a",))
+            if creator:
+                detailed["creators"] = creator
+                Actor.log.info(f"Found creators: {detailed['creators']}")
+
+        # Extract summary/description - fallback when JSON fast path missed it
+        if not detailed["summary"]:
+            summary_selectors = [
+                "#description-inline-expander span.yt-core-attributed-string--link-inherit-color",
+            ]
+
+            description = ""
+            summaryList = page.locator(summary_selectors[0])
+            count = await summaryList.count()
+            if count > 0:
+                for i in range(count):
+                    summaryElement = summaryList.nth(i)
+                    summary = await summaryElement.text_content()
+                    if summary:
+                        description += summary.strip()
+                    else:
+                        continue
+                detailed["summary"] = description
+                Actor.log.info(f"Found summary: {detailed['summary']}")
+
+    except PlaywrightError as e:
+        if _is_closed_error(e):
+            Actor.log.warning(f"Page/context closed during video info extraction: {e}")
+            return detailed
+        Actor.log.error(f"Playwright error extracting YouTube video info: {e}")
+    except Exception as e:
+        Actor.log.error(f"Error extracting YouTube video info: {e}")
+
+    return detailed
+
+
 async def main() -> None:
     """Define a main entry point for the Apify Actor.
 
@@ -113,11 +595,28 @@ async def main() -> None:
         # Get max videos to scrape (default 30)
         max_videos = int(actor_input.get("max_videos", 30))
 
+        # Resolve the channel once here; the request handler closes over it
+        # instead of re-reading the immutable input from the key-value store
+        # on every request.
+        channel_name = actor_input.get("channel", "").translate(_CHANNEL_TRANS)
+        if not channel_name:
+            Actor.log.warning("No channel name provided, using default")
+            channel_name = "unknown"
+
         # Create a crawler with English language preference
         crawler = PlaywrightCrawler(
             # Allow enough requests for initial page + videos
             max_requests_per_crawl=max_videos + 1,
             headless=True,
+            # Share one warm browser context across all detail visits so
+            # DNS, TLS sessions and the HTTP cache carry over between pages
+            use_incognito_pages=False,
+            # Detail pages are independent of each other, so let the crawler
+            # fan them out over several pages instead of serializing on one tab
+            concurrency_settings=ConcurrencySettings(
+                desired_concurrency=5,
+                max_concurrency=10,
+            ),
             browser_launch_options={
                 "args": [
                     "--disable-gpu",
@@ -130,12 +629,43 @@ async def main() -> None:
                     "--disable-setuid-sandbox",
                     "--disable-web-security",
                     "--disable-features=IsolateOrigins,site-per-process",
+                    # Keep a disk cache so repeated youtube.com/ytimg.com asset
+                    # loads across detail pages reuse connections and bytes
+                    "--disk-cache-size=536870912",
                 ],
             },
             # Increase navigation timeout (Crawlee expects timedelta object)
             navigation_timeout=timedelta(seconds=120),  # 120 seconds
+            # Bake locale and headers into every context so each new page is
+            # born configured instead of being patched per navigation
+            browser_new_context_options={
+                "locale": "en-US",
+                "extra_http_headers": _EXTRA_HTTP_HEADERS,
+            },
         )
 
+        # Collect detail results across handler invocations for the final
+        # aggregated JSON written after the crawl finishes.
+        detailed_video_info_list: list[dict[str, Any]] = []
+
+        @crawler.pre_navigation_hook
+        async def block_unneeded_resources(
+            context: PlaywrightPreNavCrawlingContext,
+        ) -> None:
+            """Abort thumbnail/media/font and ad-network requests before
+            navigation. Language headers come from the context options."""
+
+            async def _route_filter(route):
+                request = route.request
+                if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+                    fragment in request.url for fragment in _BLOCKED_URL_FRAGMENTS
+                ):
+                    await route.abort()
+                else:
+                    await route.continue_()
+
+            await context.page.route("**/*", _route_filter)
+
         # Define a request handler, which will be called for every request.
         @crawler.router.default_handler
         async def request_handler(context: PlaywrightCrawlingContext) -> None:
@@ -144,36 +674,22 @@ async def main() -> None:
             label = user_data.get("label")
 
             if label == "DETAIL":
-                # Handle detail page
+                # Handle detail page (the crawler has already navigated here)
                 Actor.log.info(f"Processing detail page: {context.request.url}")
 
+                # Listing data for this video travels along with the request
+                video = dict(user_data.get("video") or {})
+                video_index = user_data.get("index")
+
                 # Check if page is still open
                 if context.page.is_closed():
                     Actor.log.warning("Page is closed, skipping detail page")
                     return
 
                 try:
-                    # Load page with 'commit' strategy for faster loading
-                    await context.page.goto(
-                        context.request.url, wait_until="commit", timeout=120000
-                    )
-                    Actor.log.info("Detail page navigation committed")
-
-                    # Wait a bit for initial content to render
-                    await context.page.wait_for_timeout(2000)
-
-                    # Extract detailed video information
-                    detailed: dict[str, Any] = {
-                        "video_url": context.request.url,
-                        "title": None,
-                        "duration": None,
-                        "likes": None,
-                        "creators": None,
-                        "summary": None,
-                        "comments_count": None,
-                    }
-
-                    # Wait for key elements to be ready
+                    # Wait for key elements to be ready - the selector waits
+                    # inside early-exit as soon as the page is usable, so no
+                    # fixed sleeps are needed around this call
                     page_ready = await wait_for_video_page_ready(
                         context.page, timeout=30000
                     )
@@ -182,69 +698,53 @@ async def main() -> None:
                             "Detail page may not be fully loaded, continuing anyway..."
                         )
 
-                    # Additional wait for dynamic content
-                    if not context.page.is_closed():
-                        await context.page.wait_for_timeout(3000)
-
-                    # Extract video information (same logic as in default handler)
-                    # ... (可以复用现有的提取逻辑)
+                    # Extract detailed video information
+                    detailed = await get_youtube_video_info(context.page)
 
-                    # For now, just push the URL to dataset
-                    await context.push_data(
-                        {
-                            "url": context.request.url,
-                            "processed": True,
-                            "label": "DETAIL",
-                        }
-                    )
-                    Actor.log.info(f"Processed detail page: {context.request.url}")
+                    # Merge detailed fields over the listing data
+                    if detailed.get("title") and not video.get("title"):
+                        video["title"] = detailed["title"]
+                    video["video_url"] = detailed.get("video_url") or video.get("link")
+                    video["duration"] = detailed.get("duration")
+                    video["likes"] = detailed.get("likes")
+                    video["creators"] = detailed.get("creators")
+                    video["summary"] = detailed.get("summary")
+                    video["comments_count"] = detailed.get("comments_count")
 
                 except PlaywrightError as e:
-                    if "Target page, context or browser has been closed" in str(
-                        e
-                    ) or "Target closed" in str(e):
+                    if _is_closed_error(e):
                         Actor.log.warning(
                             f"Page/context closed during detail page processing: {e}"
                         )
-                        return
-                    Actor.log.error(f"Error processing detail page: {e}")
+                    else:
+                        Actor.log.error(f"Error processing detail page: {e}")
                 except Exception as e:
                     Actor.log.error(f"Error processing detail page: {e}")
 
+                # Push whatever we have (basic listing info on failure).
+                # push_data batches uploads internally; the aggregated
+                # video_information.json after the crawl covers the
+                # key-value-store copy, so no per-video file is written.
+                detailed_video_info_list.append(video)
+                await context.push_data(video)
+                Actor.log.info(
+                    f"Saved video {video_index} to dataset: "
+                    f"{video.get('title', 'Unknown')}"
+                )
+
                 return  # Exit early for detail pages
 
             # Default handler for channel/video list pages
             Actor.log.info("Scraping is started")
 
-            # There is no Flask request context here; use Actor input or context.request.url
-            # This is just a structural fix. Adapt as needed for actual Actor input source.
-            actor_input = await Actor.get_input() or {}
-            channel_name = (
-                actor_input.get("channel", "").replace(" ", "").replace("@", "")
-            )
-            if not channel_name:
-                Actor.log.warning("No channel name provided, using default")
-                channel_name = "unknown"
-            # Force English page with language parameters
             url = f"https://www.youtube.com/@{channel_name}/videos"
-            headers = {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/58.0.3029.110 Safari/537.36"
-                ),
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            }
 
             Actor.log.info(f"Navigating to {url} using Playwright...")
 
-            # Navigate to the URL using Playwright page (can execute JavaScript)
-            await context.page.goto(url, wait_until="load", timeout=60000)
-
-            # Wait for page to fully load and JavaScript to render content
-            Actor.log.info("Waiting for page content to load...")
-            await context.page.wait_for_timeout(8000)  # Wait for JavaScript to render
+            # Navigate to the URL using Playwright page (can execute JavaScript).
+            # 'domcontentloaded' fires much earlier than 'load' on YouTube; the
+            # selector wait below covers the actual grid rendering.
+            await context.page.goto(url, wait_until="domcontentloaded", timeout=60000)
 
             # Try to wait for ytd-two-column-browse-results-renderer to appear
             try:
@@ -265,13 +765,7 @@ async def main() -> None:
             vid_elements_count = 0
 
             # Try multiple selectors
-            video_selectors = [
-                "ytd-two-column-browse-results-renderer div#primary ytd-rich-grid-renderer div#contents ytd-rich-item-renderer",
-                "ytd-rich-grid-renderer div#contents ytd-rich-item-renderer",
-                "ytd-rich-item-renderer",
-            ]
-
-            for selector in video_selectors:
+            for selector in _VIDEO_GRID_SELECTORS:
                 try:
                     vid_elements_locator = context.page.locator(selector)
                     vid_elements_count = await vid_elements_locator.count()
@@ -281,52 +775,142 @@ async def main() -> None:
                         )
                         break
                 except Exception as e:
-                    Actor.log.debug(f"Error with selector {selector}: {e}")
+                    Actor.log.debug("Error with selector %s: %s", selector, e)
                     continue
 
             if vid_elements_count == 0:
                 Actor.log.warning("No video elements found with any selector")
                 vid_elements_locator = None
 
+            # The initial render only ships the first batch of cards; scroll
+            # until the page stops growing (or we have enough) to trigger
+            # the lazy-loaded rest
+            if vid_elements_locator is not None and vid_elements_count < max_videos:
+                await _scroll_until_stable(context.page)
+                vid_elements_count = await vid_elements_locator.count()
+                Actor.log.info(
+                    f"Grid grew to {vid_elements_count} elements after scrolling"
+                )
+
+            # Extract all listing fields in a single evaluate - walking the
+            # grid in-page replaces ~5 locator round-trips per video with one
+            # call for the whole batch.
             video_info_list = []
-            for i in range(min(vid_elements_count, max_videos)):
+            limit = min(vid_elements_count, max_videos)
+            if limit > 0:
                 try:
-                    video_info = {}
-                    element = vid_elements_locator.nth(i)
-                    video_info["video_url"] = context.page.url
-
-                    video_info["title"] = (
-                        await element.locator("a#video-title-link").first.get_attribute(
-                            "aria-label"
-                        )
-                        or await element.locator(
-                            "a#video-title-link"
-                        ).first.text_content()
+                    video_info_list = await context.page.evaluate(
+                        """(max) => Array.from(
+                            document.querySelectorAll('ytd-rich-item-renderer')
+                        ).slice(0, max).map((el) => {
+                            const a = el.querySelector('a#video-title-link');
+                            const img = el.querySelector('img');
+                            const spans = Array.from(el.querySelectorAll('span'));
+                            return {
+                                title: a?.getAttribute('aria-label')
+                                    || a?.textContent?.trim() || null,
+                                link: a?.getAttribute('href') || null,
+                                thumbnail: img?.getAttribute('src') || null,
+                                viscount: spans.find(
+                                    (s) => s.textContent.includes('views')
+                                )?.textContent || null,
+                                age: spans.find(
+                                    (s) => s.textContent.includes('ago')
+                                )?.textContent || null,
+                            };
+                        })""",
+                        limit,
                     )
+                    for video_info in video_info_list:
+                        video_info["video_url"] = context.page.url
+                    Actor.log.info(
+                        f"Extracted {len(video_info_list)} videos in one batch evaluate"
+                    )
+                except Exception as e:
+                    Actor.log.warning(
+                        f"Batch listing extraction failed, falling back to locators: {e}"
+                    )
+                    video_info_list = []
 
-                    video_info["thumbnail"] = await element.locator(
-                        "img"
-                    ).first.get_attribute("src")
+            # Fallback: per-element extraction over handles resolved once.
+            # locator.nth(i) would re-run the grid selector for every index,
+            # while element_handles() materializes the matches in one query.
+            if not video_info_list and vid_elements_locator is not None:
+                handles = await vid_elements_locator.element_handles()
 
-                    video_info["link"] = await element.locator(
-                        "a#video-title-link"
-                    ).first.get_attribute("href")
+                async def _attr(handle, name):
+                    return await handle.get_attribute(name) if handle else None
 
-                    video_info["viscount"] = await element.locator(
-                        'span:has-text("views")'
-                    ).first.text_content()
+                async def _text(handle):
+                    return await handle.text_content() if handle else None
 
-                    video_info["age"] = await element.locator(
-                        'span:has-text("ago")'
-                    ).first.text_content()
-                    video_info_list.append(video_info)
+                # Bound how many items are in flight at once so the gather
+                # below doesn't flood the browser with protocol messages
+                extraction_sem = asyncio.Semaphore(8)
 
-                except Exception as e:
-                    Actor.log.warning(f"Error extracting data from element {i}: {e}")
+                async def extract_one(i, element):
+                    async with extraction_sem:
+                        try:
+                            # Fire the sub-element lookups and attribute reads
+                            # concurrently - the protocol pipelines them, so
+                            # each item costs max-of-N round-trips, not sum.
+                            # Views and age sit in fixed order inside
+                            # #metadata-line, which is far cheaper to resolve
+                            # than scanning every span with :has-text().
+                            title_link, img, meta_spans = await asyncio.gather(
+                                element.query_selector("a#video-title-link"),
+                                element.query_selector("img"),
+                                element.query_selector_all("#metadata-line span"),
+                            )
+                            views = meta_spans[0] if meta_spans else None
+                            age = meta_spans[1] if len(meta_spans) > 1 else None
+                            if views is None:
+                                # Fallback to text matching when the metadata
+                                # line is missing from this card variant
+                                views, age = await asyncio.gather(
+                                    element.query_selector('span:has-text("views")'),
+                                    element.query_selector('span:has-text("ago")'),
+                                )
+                            (
+                                aria,
+                                title_text,
+                                href,
+                                thumbnail,
+                                viscount,
+                                age_text,
+                            ) = await asyncio.gather(
+                                _attr(title_link, "aria-label"),
+                                _text(title_link),
+                                _attr(title_link, "href"),
+                                _attr(img, "src"),
+                                _text(views),
+                                _text(age),
+                            )
+                            return {
+                                "video_url": context.page.url,
+                                "title": aria or title_text,
+                                "thumbnail": thumbnail,
+                                "link": href,
+                                "viscount": viscount,
+                                "age": age_text,
+                            }
+                        except Exception as e:
+                            Actor.log.warning(
+                                f"Error extracting data from element {i}: {e}"
+                            )
+                            return None
+
+                extracted = await asyncio.gather(
+                    *(
+                        extract_one(i, element)
+                        for i, element in enumerate(handles[:limit])
+                    )
+                )
+                video_info_list = [video for video in extracted if video]
 
             # Save individual video data to separate JSON file with UTF-8 encoding
             video_filename = f"video_info_list.json"
-            video_json_data = json.dumps(video_info_list, ensure_ascii=False, indent=2)
+            video_json_data = orjson.dumps(video_info_list)
             await Actor.set_value(
                 video_filename,
                 video_json_data,
@@ -334,470 +918,64 @@ async def main() -> None:
             )
             Actor.log.info(f"Saved video data to {video_filename} (UTF-8 encoding)")
 
-            # 第二步：将详情页请求加入队列（由其他Handler处理）
+            # Enqueue detail-page requests; the crawler processes them
+            # concurrently in the DETAIL branch above.
             Actor.log.info(f"Enqueueing {len(video_info_list)} video detail pages...")
-            for video in video_info_list:
+            detail_requests = []
+            # Set-based membership keeps the duplicate check O(1); dense
+            # grids can surface the same video under several cards
+            seen_links: set[str] = set()
+            for index, video in enumerate(video_info_list, start=1):
                 link = video.get("link")
                 if not link:
+                    # Nothing to visit - push the basic listing info as-is
+                    detailed_video_info_list.append(video)
+                    await context.push_data(video)
                     continue
 
                 # Ensure full URL
                 if link.startswith("/"):
                     link = f"https://www.youtube.com{link}"
 
-                # 将详情页请求加入队列
-                request = Request(
-                    url=link, user_data={"label": "DETAIL"}  # 标记为详情页
-                )
-                await context.crawler.request_queue.add_request(request)
-                Actor.log.debug(f"Enqueued detail page: {link}")
-
-            Actor.log.info(
-                f"Successfully enqueued {len(video_info_list)} detail page requests"
-            )
-
-            # Visit each video page to gather detailed info (comments count, likes, etc.)
-            # Process videos sequentially (one by one)
-            # Process videos one by one (sequentially)
-            Actor.log.info(f"Processing {len(video_info_list)} videos sequentially...")
-
-            # Track all processed videos for final JSON save
-            detailed_video_info_list = []
-
-            # Counter for individual video JSON files
-            video_counter = 1
-
-            for video in video_info_list:
-                link = video.get("link")
-                if not link:
-                    detailed_video_info_list.append(video)
-                    # Save individual video data to separate JSON file with UTF-8 encoding
-                    video_filename = f"video{video_counter}.json"
-                    video_json_data = json.dumps(video, ensure_ascii=False, indent=2)
-                    await Actor.set_value(
-                        video_filename,
-                        video_json_data,
-                        content_type="application/json; charset=utf-8",
-                    )
-                    Actor.log.info(
-                        f"Saved video data to {video_filename} (UTF-8 encoding)"
-                    )
-                    video_counter += 1
+                # Shorts and autoplay mixes render like video cards but a
+                # full detail visit on them extracts nothing useful
+                if "/shorts/" in link or "list=RD" in link:
+                    Actor.log.debug("Skipping shorts/mix link: %s", link)
                     continue
 
-                try:
-                    # Ensure full URL
-                    if link.startswith("/"):
-                        link = f"https://www.youtube.com{link}"
-                        video["link"] = link
-
-                    # Navigate to video page with optimized loading
-                    Actor.log.info(f"Visiting video: {link}")
-
-                    # Check if page is still open before navigation
-                    if context.page.is_closed():
-                        Actor.log.warning("Page is closed, skipping video")
-                        continue
-
-                    try:
-                        # Load page with 'commit' strategy for faster loading
-                        # 'commit' waits for navigation to commit, which is faster than 'load'
-                        await context.page.goto(
-                            link, wait_until="commit", timeout=120000
-                        )
-                        Actor.log.info("Page navigation committed")
-
-                        # Wait a bit for initial content to render
-                        await context.page.wait_for_timeout(2000)
-                    except PlaywrightError as e:
-                        if "Target page, context or browser has been closed" in str(
-                            e
-                        ) or "Target closed" in str(e):
-                            Actor.log.warning(
-                                f"Page/context closed during navigation: {e}"
-                            )
-                            continue
-                        raise
-
-                    # Check if page is still open before operations
-                    if context.page.is_closed():
-                        Actor.log.warning("Page is closed, skipping video extraction")
-                        continue
-
-                    # Check for YouTube restrictions (age verification, region block, etc.)
-                    try:
-                        # Check for age verification page
-                        age_verification = await context.page.locator(
-                            "ytd-age-gate-renderer, #age-gate-container"
-                        ).count()
-                        if age_verification > 0:
-                            Actor.log.warning(
-                                "Age verification required - video may be restricted"
-                            )
-
-                        # Check for unavailable video
-                        unavailable = await context.page.locator(
-                            "ytd-watch-flexy[unavailable], #unavailable-message"
-                        ).count()
-                        if unavailable > 0:
-                            Actor.log.warning("Video is unavailable")
-                    except PlaywrightError as e:
-                        if "Target page, context or browser has been closed" in str(
-                            e
-                        ) or "Target closed" in str(e):
-                            Actor.log.warning(
-                                f"Page/context closed during restriction check: {e}"
-                            )
-                            continue
-                        pass
-                    except Exception:
-                        pass
-
-                    # Wait for key elements to be ready with increased timeout
-                    try:
-                        page_ready = await wait_for_video_page_ready(
-                            context.page, timeout=30000  # Increased to 30 seconds
-                        )
-                        if not page_ready:
-                            Actor.log.warning(
-                                f"Video page may not be fully loaded, continuing anyway..."
-                            )
-
-                        # Additional wait for dynamic content to ensure everything is loaded
-                        if not context.page.is_closed():
-                            await context.page.wait_for_timeout(
-                                3000
-                            )  # Increased to 3 seconds
-                    except PlaywrightError as e:
-                        if "Target page, context or browser has been closed" in str(
-                            e
-                        ) or "Target closed" in str(e):
-                            Actor.log.warning(f"Page/context closed during wait: {e}")
-                            continue
-                        raise
-
-                    # Extract detailed video information directly
-                    # Initialize video info dictionary
-                    try:
-                        video_url = context.page.url
-                    except PlaywrightError as e:
-                        if "Target page, context or browser has been closed" in str(
-                            e
-                        ) or "Target closed" in str(e):
-                            Actor.log.warning(
-                                f"Page/context closed when getting URL: {e}"
-                            )
-                            continue
-                        video_url = link
-
-                    detailed: dict[str, Any] = {
-                        "video_url": video_url,
-                        "title": None,
-                        "duration": None,
-                        "likes": None,
-                        "creators": None,
-                        "summary": None,
-                        "comments_count": None,
-                    }
-
-                    # Check if page is still open before extraction
-                    if context.page.is_closed():
-                        Actor.log.warning("Page is closed, skipping video extraction")
-                        continue
-
-                    try:
-                        # Extract duration - try multiple selectors
-                        duration_selectors = [
-                            'meta[itemprop="duration"]',  # Structured data (ISO 8601 format)
-                            "span.ytp-time-duration",  # Video player duration
-                            ".ytp-time-duration",  # Alternative player duration selector
-                            "ytd-thumbnail-overlay-time-status-renderer span",  # Thumbnail overlay duration
-                            "span.style-scope.ytd-thumbnail-overlay-time-status-renderer",  # Alternative thumbnail duration
-                            'yt-formatted-string[aria-label*="duration"]',  # Formatted string with duration
-                            '.ytd-watch-info-text span:has-text(":")',  # Watch info text with time format
-                        ]
-
-                        duration = None
-                        for selector in duration_selectors:
-                            try:
-                                # Check if page is still open
-                                if context.page.is_closed():
-                                    break
-                                element = context.page.locator(selector).first
-                                if await element.count() > 0:
-                                    # Try to get content attribute first (for meta tags)
-                                    if selector.startswith("meta"):
-                                        duration = await element.get_attribute(
-                                            "content"
-                                        )
-                                    else:
-                                        # For other elements, get text content
-                                        duration = await element.text_content()
-
-                                    if duration:
-                                        duration = duration.strip()
-                                        # Check if it's ISO 8601 format (PT4M13S)
-                                        if duration.startswith("PT"):
-                                            # Parse ISO 8601 duration format (PT4M13S -> 4:13)
-                                            duration = (
-                                                duration.replace("PT", "")
-                                                .replace("H", ":")
-                                                .replace("M", ":")
-                                                .replace("S", "")
-                                            )
-                                            # Handle cases like "4:13" or ":13" (missing minutes)
-                                            parts = duration.split(":")
-                                            if len(parts) == 2 and not parts[0]:
-                                                duration = f"0:{parts[1]}"
-                                            elif len(parts) == 3:
-                                                # Format: H:M:S -> H:MM:SS
-                                                hours, minutes, seconds = parts
-                                                if not hours:
-                                                    hours = "0"
-                                                if not minutes:
-                                                    minutes = "0"
-                                                if not seconds:
-                                                    seconds = "0"
-                                                duration = f"{hours}:{minutes.zfill(2)}:{seconds.zfill(2)}"
-                                            detailed["duration"] = duration.strip()
-                                            Actor.log.info(
-                                                f"Found duration with selector '{selector}': {detailed['duration']}"
-                                            )
-                                            break
-                                        # Check if it's already in time format (MM:SS or HH:MM:SS)
-                                        elif re.match(
-                                            r"^\d{1,2}:\d{2}(:\d{2})?$", duration
-                                        ):
-                                            detailed["duration"] = duration
-                                            Actor.log.info(
-                                                f"Found duration with selector '{selector}': {detailed['duration']}"
-                                            )
-                                            break
-                            except PlaywrightError as e:
-                                if (
-                                    "Target page, context or browser has been closed"
-                                    in str(e)
-                                    or "Target closed" in str(e)
-                                ):
-                                    Actor.log.warning(
-                                        f"Page/context closed during duration extraction: {e}"
-                                    )
-                                    raise
-                                Actor.log.debug(
-                                    f"Error with duration selector '{selector}': {e}"
-                                )
-                                continue
-                            except Exception as e:
-                                Actor.log.debug(
-                                    f"Error with duration selector '{selector}': {e}"
-                                )
-                                continue
-
-                        if not detailed["duration"]:
-                            Actor.log.warning(
-                                "Could not extract video duration with any selector"
-                            )
-
-                        # Extract likes - use the specific selector from YouTube
-                        likes_selectors = [
-                            "segmented-like-dislike-button-view-model button .yt-spec-button-shape-next__button-text-content",
-                            'button[aria-label*="like"] span',
-                            'yt-formatted-string[id="text"]:has-text("likes")',
-                            '[aria-label*="like"]',
-                            'button[aria-label*="Like"]',
-                        ]
-
-                        for selector in likes_selectors:
-                            try:
-                                # Try to find like button and extract the count
-                                like_button = context.page.locator(selector).first
-                                if await like_button.count() > 0:
-                                    # Get text content from the element
-                                    text = await like_button.text_content()
-                                    if text:
-                                        text = text.strip()
-                                        # Extract number from text (e.g., "1.2K", "123", "1.5M")
-                                        match = re.search(
-                                            r"([\d,\.]+[KMB]?)", text, re.IGNORECASE
-                                        )
-                                        if match:
-                                            detailed["likes"] = match.group(1)
-                                            Actor.log.info(
-                                                f"Found likes: {detailed['likes']}"
-                                            )
-                                            break
-                                        # If no match but text exists, use it directly
-                                        elif text:
-                                            detailed["likes"] = text
-                                            Actor.log.info(
-                                                f"Found likes (direct): {detailed['likes']}"
-                                            )
-                                            break
-
-                                    # Try to get aria-label as fallback
-                                    aria_label = await like_button.get_attribute(
-                                        "aria-label"
-                                    )
-                                    if aria_label:
-                                        # Extract number from aria-label like "1.2K likes" or "123 likes"
-                                        match = re.search(
-                                            r"([\d,\.]+[KMB]?)\s*likes?",
-                                            aria_label,
-                                            re.IGNORECASE,
-                                        )
-                                        if match:
-                                            detailed["likes"] = match.group(1)
-                                            Actor.log.info(
-                                                f"Found likes from aria-label: {detailed['likes']}"
-                                            )
-                                            break
-                            except Exception as e:
-                                Actor.log.debug(f"Error with selector {selector}: {e}")
-                                continue
-
-                        # Extract comments count - try multiple selectors
-                        comments_selectors = [
-                            "#title.style-scope.ytd-comments-header-renderer yt-formatted-string span",
-                            "ytd-comments-header-renderer #count",
-                            "ytd-comments-header-renderer .count-text",
-                            "ytd-comments-header-renderer #title #count",
-                            "yt-formatted-string.count-text",
-                            "h2#count yt-formatted-string span",
-                        ]
-
-                        # Attempt to scroll to comments to ensure lazy-loaded content appears
-                        try:
-                            await context.page.evaluate(
-                                "window.scrollBy(0, document.body.scrollHeight / 2);"
-                            )
-                            await context.page.wait_for_timeout(
-                                1000
-                            )  # Reduced from 2000 to 1000
-                        except Exception:
-                            pass
-
-                        for selector in comments_selectors:
-                            try:
-                                element = context.page.locator(selector).first
-                                if await element.count() > 0:
-                                    comments_text = await element.text_content()
-                                    if comments_text:
-                                        detailed["comments_count"] = comments_text
-                                        Actor.log.info(
-                                            f"Found comments count: {detailed['comments_count']}"
-                                        )
-                                        break
-                            except Exception as e:
-                                Actor.log.debug(
-                                    f"Error with comments selector {selector}: {e}"
-                                )
-
-                        # Extract creator/channel name - try multiple selectors
-                        creator = await context.page.locator(
-                            "ytd-channel-name a"
-                        ).first.text_content()
-                        if creator:
-                            detailed["creators"] = creator
-                            Actor.log.info(f"Found creators: {detailed['creators']}")
-
-                        # Extract summary/description - try multiple selectors
-                        summary_selectors = [
-                            "#description-inline-expander span.yt-core-attributed-string--link-inherit-color",
-                        ]
-
-                        description = ""
-                        summaryList = context.page.locator(summary_selectors[0])
-                        count = await summaryList.count()
-                        if count > 0:
-                            for i in range(count):
-                                summaryElement = summaryList.nth(i)
-                                summary = await summaryElement.text_content()
-                                if summary:
-                                    description += summary.strip()
-                                else:
-                                    continue
-                            detailed["summary"] = description
-                            Actor.log.info(f"Found summary: {detailed['summary']}")
-
-                    except PlaywrightError as e:
-                        if "Target page, context or browser has been closed" in str(
-                            e
-                        ) or "Target closed" in str(e):
-                            Actor.log.warning(
-                                f"Page/context closed during video info extraction: {e}"
-                            )
-                            continue
-                        Actor.log.error(
-                            f"Playwright error extracting YouTube video info: {e}"
-                        )
-                        continue
-                    except Exception as e:
-                        Actor.log.error(f"Error extracting YouTube video info: {e}")
+                # Canonicalize to a bare watch URL so tracking parameters
+                # (&pp=..., &t=...) don't produce distinct queue entries for
+                # the same video
+                match = _WATCH_ID_RE.search(link)
+                if match:
+                    video_id = match.group(1)
+                    # Real video IDs are always 11 characters
+                    if len(video_id) != 11:
+                        Actor.log.debug("Skipping malformed video link: %s", link)
                         continue
+                    link = f"https://www.youtube.com/watch?v={video_id}"
+                video["link"] = link
 
-                    # Merge detailed fields
-                    video["video_url"] = detailed.get("video_url", link)
-                    video["duration"] = detailed.get("duration")
-                    video["likes"] = detailed.get("likes")
-                    video["creators"] = detailed.get("creators")
-                    video["summary"] = detailed.get("summary")
-                    video["comments_count"] = detailed.get("comments_count")
-
-                    detailed_video_info_list.append(video)
-
-                    # Push each video individually to dataset immediately
-                    await context.push_data(video)
-                    Actor.log.info(
-                        f"Saved video to dataset: {video.get('title', 'Unknown')}"
-                    )
-
-                    # Save individual video data to separate JSON file with UTF-8 encoding
-                    video_filename = f"video{video_counter}.json"
-                    video_json_data = json.dumps(video, ensure_ascii=False, indent=2)
-                    await Actor.set_value(
-                        video_filename,
-                        video_json_data,
-                        content_type="application/json; charset=utf-8",
-                    )
-                    Actor.log.info(
-                        f"Saved video data to {video_filename} (UTF-8 encoding)"
-                    )
-                    video_counter += 1
-
-                except Exception as e:
-                    Actor.log.warning(f"Error visiting video {link}: {e}")
-                    # Still save the basic video info even if detailed extraction failed
-                    detailed_video_info_list.append(video)
-                    await context.push_data(video)
-                    Actor.log.info(
-                        f"Saved basic video info to dataset: {video.get('title', 'Unknown')}"
-                    )
+                if link in seen_links:
+                    Actor.log.debug("Skipping duplicate video link: %s", link)
+                    continue
+                seen_links.add(link)
 
-                    # Save individual video data to separate JSON file with UTF-8 encoding
-                    video_filename = f"video{video_counter}.json"
-                    video_json_data = json.dumps(video, ensure_ascii=False, indent=2)
-                    await Actor.set_value(
-                        video_filename,
-                        video_json_data,
-                        content_type="application/json; charset=utf-8",
-                    )
-                    Actor.log.info(
-                        f"Saved video data to {video_filename} (UTF-8 encoding)"
+                detail_requests.append(
+                    Request.from_url(
+                        link,
+                        user_data={
+                            "label": "DETAIL",
+                            "video": video,
+                            "index": index,
+                        },
                     )
-                    video_counter += 1
+                )
+                Actor.log.debug("Enqueued detail page: %s", link)
 
-            # Save all video_info_list to JSON file in key-value store (for backup/reference)
+            await context.add_requests(detail_requests)
             Actor.log.info(
-                f"Saving {len(detailed_video_info_list)} video information to JSON file..."
-            )
-            json_data = json.dumps(
-                detailed_video_info_list, ensure_ascii=False, indent=2
-            )
-            await Actor.set_value(
-                "video_information.json", json_data, content_type="application/json"
-            )
-            Actor.log.info(
-                "Video information saved to key-value store as 'video_information.json'"
+                f"Successfully enqueued {len(detail_requests)} detail page requests"
             )
 
         # Reset scraped count at start
@@ -805,3 +983,15 @@ async def main() -> None:
 
         # Run the crawler with the starting requests.
         await crawler.run(start_urls)
+
+        # Save all collected video info to JSON file in key-value store (for backup/reference)
+        Actor.log.info(
+            f"Saving {len(detailed_video_info_list)} video information to JSON file..."
+        )
+        json_data = orjson.dumps(detailed_video_info_list)
+        await Actor.set_value(
+            "video_information.json", json_data, content_type="application/json"
+        )
+        Actor.log.info(
+            "Video information saved to key-value store as 'video_information.json'"
+        )